@@ -0,0 +1,298 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#   FILE: Feature.py
+#   REVISION: October, 2026
+#   CREATION DATE: October, 2026
+#
+#   A compact, memory efficient representation of one USGS wildfire GeoJSON feature. This class is part of
+#   the wildfire user module.
+#
+#   Copyright by Author. All rights reserved. Not for reuse without express permissions.
+#
+
+import sys
+from array import array
+
+
+#
+#   The attribute fields of the USGS combined/merged wildfire datasets, in the order they are listed in the
+#   'fields' part of the file header. Each one of these becomes a typed slot on a Feature object.
+#
+USGS_ATTRIBUTE_FIELDS = (
+    "OBJECTID",
+    "USGS_Assigned_ID",
+    "Assigned_Fire_Type",
+    "Fire_Year",
+    "Fire_Polygon_Tier",
+    "Fire_Attribute_Tiers",
+    "GIS_Acres",
+    "GIS_Hectares",
+    "Source_Datasets",
+    "Listed_Fire_Types",
+    "Listed_Fire_Names",
+    "Listed_Fire_Codes",
+    "Listed_Fire_IDs",
+    "Listed_Fire_IRWIN_IDs",
+    "Listed_Fire_Dates",
+    "Listed_Fire_Causes",
+    "Listed_Fire_Cause_Class",
+    "Listed_Rx_Reported_Acres",
+    "Listed_Map_Digitize_Methods",
+    "Listed_Notes",
+    "Processing_Notes",
+    "Wildfire_Notice",
+    "Prescribed_Burn_Notice",
+    "Wildfire_and_Rx_Flag",
+    "Overlap_Within_1_or_2_Flag",
+    "Circleness_Scale",
+    "Circle_Flag",
+    "Exclude_From_Summary_Rasters",
+    "Shape_Length",
+    "Shape_Area"
+)
+
+#
+#   Short, heavily repeated strings (fire types, notices, flags) are interned so that every feature shares
+#   one copy of the string rather than each feature holding its own. The long notice text alone is over 1KB
+#   per feature in the USGS data.
+#
+INTERNED_ATTRIBUTE_FIELDS = (
+    "Assigned_Fire_Type",
+    "Listed_Fire_Types",
+    "Listed_Fire_Cause_Class",
+    "Wildfire_Notice",
+    "Prescribed_Burn_Notice",
+    "Wildfire_and_Rx_Flag",
+    "Exclude_From_Summary_Rasters"
+)
+
+
+class Feature(object):
+    '''
+
+    This class implements a compact representation of a single GeoJSON feature from the USGS wildfire
+    datasets. The Reader returns each feature as nested python dictionaries, which stores every vertex of a
+    fire perimeter as a python list of two python floats. That costs well over 100 bytes for 16 bytes of
+    coordinate data, so keeping a whole dataset in memory gets very expensive.
+
+    A Feature keeps each of the USGS attribute fields in a typed slot, and keeps all of the ring vertices in
+    one flat array('d') of interleaved x,y values, with a second array of offsets marking where each ring
+    starts. The class provides:
+        from_dict()   - to create a Feature from a feature dictionary returned by the Reader
+        to_dict()     - to rebuild the original nested feature dictionary
+        ring_count()  - the number of rings in the geometry
+        ring()        - the x,y array('d') values of one ring, without building python lists
+        ring_xy()     - the x and y values of one ring as two separate array('d') values
+
+    For compatibility with code written against the dictionary features, a Feature can also be indexed like
+    the dictionary it replaces
+
+        feature['attributes']['Fire_Year']
+        feature['geometry']['rings'][0]
+
+    Those lookups rebuild python dictionaries and lists on each call, so code that touches many features
+    should prefer the attribute form, e.g. 'feature.Fire_Year' or 'feature.ring(0)'. They also return
+    read-only copies - a change like "feature['attributes']['Fire_Year'] = 1" changes only the copy, and is
+    lost. To change a feature, set the attribute directly (feature.Fire_Year = 1), or convert it back to a
+    dictionary with to_dict() first. A Feature is not a dict, so it must also go through to_dict() before it
+    can be serialized with json.dump().
+
+    '''
+    __slots__ = USGS_ATTRIBUTE_FIELDS + ("coords", "ring_offsets", "extra_attributes", "extra_geometry")
+
+    def __init__(self):
+        super().__init__()
+        for name in USGS_ATTRIBUTE_FIELDS:
+            setattr(self, name, None)
+        self.coords = array('d')
+        self.ring_offsets = array('q', [0])
+        self.extra_attributes = None
+        self.extra_geometry = None
+        return
+
+
+    #####
+    #
+    #   PUBLIC METHODS
+    #
+    #####
+
+    @classmethod
+    def from_dict(cls, feature_dict=None):
+        '''
+        This creates a new Feature from one feature dictionary, as returned by Reader.next().
+
+        The method takes one parameter, the feature dictionary to be converted. Any attributes that are not
+        part of the USGS schema, and any geometry other than 'rings' (e.g. 'curveRings'), are kept as they
+        are so that nothing from the original feature is lost.
+
+        '''
+        if feature_dict is None:
+            raise Exception("Must supply a feature dictionary to 'from_dict()'")
+
+        feature = cls()
+
+        attributes = feature_dict.get('attributes') or dict()
+        for name, value in attributes.items():
+            if name in INTERNED_ATTRIBUTE_FIELDS and isinstance(value, str):
+                value = sys.intern(value)
+            if name in USGS_ATTRIBUTE_FIELDS:
+                setattr(feature, name, value)
+            else:
+                if feature.extra_attributes is None:
+                    feature.extra_attributes = dict()
+                feature.extra_attributes[name] = value
+
+        geometry = feature_dict.get('geometry') or dict()
+        for key, value in geometry.items():
+            if key == 'rings':
+                feature.__pack_rings__(value)
+            else:
+                if feature.extra_geometry is None:
+                    feature.extra_geometry = dict()
+                feature.extra_geometry[key] = value
+        return feature
+
+
+    def to_dict(self):
+        '''
+        This rebuilds and returns the nested feature dictionary that this Feature was created from.
+
+        This method takes no parameters.
+
+        '''
+        return {'attributes': self.attributes(), 'geometry': self.geometry()}
+
+
+    def attributes(self):
+        '''
+        This returns a new dictionary of the feature attributes, with the same keys as the original feature.
+
+        This method takes no parameters.
+
+        '''
+        attributes = {name: getattr(self, name) for name in USGS_ATTRIBUTE_FIELDS}
+        if self.extra_attributes:
+            attributes.update(self.extra_attributes)
+        return attributes
+
+
+    def geometry(self):
+        '''
+        This returns a new geometry dictionary, rebuilding the 'rings' as lists of [x,y] coordinate lists.
+
+        This method takes no parameters.
+
+        '''
+        geometry = dict()
+        if self.ring_count() or not self.extra_geometry:
+            geometry['rings'] = [self.__ring_as_list__(i) for i in range(self.ring_count())]
+        if self.extra_geometry:
+            geometry.update(self.extra_geometry)
+        return geometry
+
+
+    def ring_count(self):
+        '''
+        This returns the number of rings in the feature geometry.
+
+        This method takes no parameters.
+
+        '''
+        return len(self.ring_offsets) - 1
+
+
+    def ring(self, index=0):
+        '''
+        This returns one ring as an array('d') of interleaved x,y values, i.e. [x0, y0, x1, y1, ...]
+
+        The method takes one parameter, the index of the ring, where ring 0 is the first ring in the geometry.
+
+        '''
+        start, end = self.__ring_bounds__(index)
+        return self.coords[2*start:2*end]
+
+
+    def ring_xy(self, index=0):
+        '''
+        This returns one ring as two array('d') values, the x values and the y values. This is the form that
+        most projection and distance code (e.g. pyproj Transformer.transform()) wants.
+
+        The method takes one parameter, the index of the ring, where ring 0 is the first ring in the geometry.
+
+        '''
+        start, end = self.__ring_bounds__(index)
+        return self.coords[2*start:2*end:2], self.coords[2*start+1:2*end:2]
+
+
+    #####
+    #
+    #   DICTIONARY COMPATIBILITY
+    #
+    #####
+
+    def __getitem__(self, key):
+        if key == 'attributes':
+            return self.attributes()
+        if key == 'geometry':
+            return self.geometry()
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in ('attributes', 'geometry')
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def keys(self):
+        return ['attributes', 'geometry']
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __repr__(self):
+        return f"Feature(OBJECTID={self.OBJECTID}, Fire_Year={self.Fire_Year}, rings={self.ring_count()})"
+
+
+    #####
+    #
+    #   NON-PUBLIC (PRIVATE) METHODS
+    #
+    #####
+
+    ####
+    #
+    #   Flattens a GeoJSON list of rings, each a list of [x,y] points, into the one coords array. The offsets
+    #   are counted in points (not values), so ring i is points ring_offsets[i] up to ring_offsets[i+1].
+    #
+    def __pack_rings__(self, rings=None):
+        coords = self.coords
+        offsets = self.ring_offsets
+        for ring in rings or list():
+            for point in ring:
+                coords.append(point[0])
+                coords.append(point[1])
+            offsets.append(len(coords)//2)
+        return
+
+    def __ring_bounds__(self, index=0):
+        if index < 0:
+            index += self.ring_count()
+        if index < 0 or index >= self.ring_count():
+            raise IndexError(f"Feature has {self.ring_count()} rings, no ring at index {index}")
+        return self.ring_offsets[index], self.ring_offsets[index+1]
+
+    def __ring_as_list__(self, index=0):
+        start, end = self.__ring_bounds__(index)
+        coords = self.coords
+        return [[coords[2*i], coords[2*i+1]] for i in range(start, end)]
+
+
+if __name__ == '__main__':
+    print("Feature.py is a class with no main()")
@@ -13,6 +13,8 @@
 
 import os, json
 
+from wildfire.Feature import Feature
+
 
 class Reader(object):
     '''
@@ -27,6 +29,8 @@ class Reader(object):
         header()  - to return the descriptive information for the dataset
         next()    - to get, one at a time, each GeoJSON feature from the file
         rewind()  - to return the file to the start of the GeoJSON features
+        tell()    - to get the file position of the next GeoJSON feature
+        seek()    - to return the file to a position saved with tell()
         close()   - to close the file
         
     The class will attempt to maintain consistency of the Reader and will throw exceptions to attempt to prevent
@@ -42,10 +46,16 @@ class Reader(object):
         reader = Reader()
         reader.open("file_to_read.json")
     
+    By default next() returns each feature as nested python dictionaries. When a whole dataset needs to be
+    held in memory, the reader can instead return compact Feature objects (see Feature.py), which keep the
+    ring coordinates in flat arrays and can still be indexed like the dictionaries
+    
+        reader = Reader("file_to_read.json", compact=True)
     
     '''
-    def __init__(self, filename=None):
+    def __init__(self, filename=None, compact=False):
         super().__init__()
+        self.compact = compact
         self.filename = ""
         self.filehandle = None
         self.is_open = False
@@ -122,12 +132,17 @@ class Reader(object):
         as a python dictionary. It reads and returns one complete feature with each call, until there are
         no more features. When there are no remaining features the method returns an empty value.
         
+        If the Reader was created with 'compact=True' each feature is returned as a Feature object instead
+        of a python dictionary.
+        
         This method takes no parameters.
         
         '''
         if not self.is_open:
             raise Exception(f"Must 'open()' a file before reading GeoJSON features")
         feature = self.__next_geojson_feature__(self.filehandle)
+        if feature and self.compact:
+            feature = Feature.from_dict(feature)
         return feature
     
     
@@ -153,6 +168,41 @@ class Reader(object):
         return 
     
     
+    #   
+    #   Return the file position of the next feature, for use with seek()
+    #    
+    def tell(self):
+        '''
+        This method returns the position in the file of the next 'feature'. The value can be saved, for
+        example in an index of the file, and later passed to seek() to read that feature again.
+        
+        This method takes no parameters.
+        
+        '''
+        if not self.is_open:
+            raise Exception(f"Must 'open()' a file before getting a file position")
+        return self.filehandle.tell()
+    
+    
+    #   
+    #   Move the file pointer to a feature position saved with tell()
+    #    
+    def seek(self, offset=None):
+        '''
+        This method moves the file handle to a position previously returned by tell(), so that the next
+        call to next() reads the feature at that position.
+        
+        The method takes one parameter, a file position returned by tell()
+        
+        '''
+        if not self.is_open:
+            raise Exception(f"Must 'open()' a file before moving to a file position")
+        if offset is None:
+            raise Exception("Must supply a file position from 'tell()' to 'seek()'")
+        self.filehandle.seek(offset,0)
+        return
+    
+    
     #   
     #   Close the file, reset the object to initial conditions
     #    
@@ -0,0 +1,26 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#   FILE: __init__.py
+#   REVISION: October, 2026
+#
+#   The wildfire user module. Submodules are loaded the first time they are used, e.g. 'wildfire.Reader',
+#   so importing the package (or running 'python -m wildfire') does not pull in pyproj, numpy or pandas
+#   unless a submodule that needs them is actually used.
+#
+#   Copyright by Author. All rights reserved. Not for reuse without express permissions.
+#
+
+import importlib
+
+SUBMODULES = ("Reader", "Feature", "county_join", "extract_subset", "test_geocalc")
+
+
+def __getattr__(name):
+    if name in SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(list(globals().keys()) + list(SUBMODULES))
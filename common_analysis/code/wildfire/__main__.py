@@ -0,0 +1,238 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#   FILE: __main__.py
+#   REVISION: October, 2026
+#   CREATION DATE: October, 2026
+#
+#   The command line for the wildfire user module. Each pass over a wildfire GeoJSON file that used to need
+#   an edit to one of the scripts (file names, commenting calls in and out of main()) is a subcommand
+#
+#       python -m wildfire header   FILE
+#       python -m wildfire count    FILE
+#       python -m wildfire extract  FILE --name NAME [--name NAME ...] [--year YEAR] [--output OUT]
+#       python -m wildfire index    FILE [--output OUT]
+#       python -m wildfire convert  FILE [--output OUT]
+#       python -m wildfire distance FILE --place PLACE [--output OUT]
+#
+#   Only the standard library and the Reader are imported at start up. pyproj is imported by the
+#   subcommands that do projection or distance work, so 'header' and 'count' start quickly.
+#
+#   Copyright by Author. All rights reserved. Not for reuse without express permissions.
+#
+
+import sys, json, csv, argparse
+
+from wildfire.Reader import Reader
+
+
+INDEX_FNAME = "wildfire_index.csv"
+CONVERTED_FNAME = "wildfire_epsg4326.json"
+DISTANCE_FNAME = "wf_data.csv"
+
+
+#
+#   Progress goes to stderr so that stdout only has the result, which keeps the output easy to pipe
+#
+def progress(message=""):
+    print(message, file=sys.stderr)
+    return
+
+
+def header_command(args):
+    wf_reader = Reader(args.file)
+    print(json.dumps(wf_reader.header(),indent=4))
+    wf_reader.close()
+    return 0
+
+
+def count_command(args):
+    from wildfire.extract_subset import streaming_load_feature_count
+    feature_count = streaming_load_feature_count(args.file, show_header=False, out=sys.stderr)
+    print(feature_count)
+    return 0
+
+
+def extract_command(args):
+    from wildfire.extract_subset import extract_samples_by_name, SAMPLE_FNAME
+    fires = {name.lower(): {"year": args.year} for name in args.name}
+    found_count = extract_samples_by_name(args.file, fires, args.output or SAMPLE_FNAME)
+    return 0 if found_count else 1
+
+
+#
+#   Writes one row per feature with the file position of that feature, so a later pass can seek() straight
+#   to the fires it wants rather than reading the whole file again
+#
+def index_command(args):
+    wf_reader = Reader(args.file)
+    out = open(args.output or INDEX_FNAME, "w", newline="")
+    writer = csv.writer(out)
+    writer.writerow(['offset', 'id', 'year', 'name', 'size', 'type'])
+
+    feature_count = 0
+    offset = wf_reader.tell()
+    feature = wf_reader.next()
+    while feature:
+        feature_count += 1
+        if (feature_count % 10000) == 0:
+            progress(f"Indexed {feature_count} features")
+        attributes = feature['attributes']
+        writer.writerow([offset, attributes['USGS_Assigned_ID'], attributes['Fire_Year'],
+                         (attributes['Listed_Fire_Names'] or '').split(',')[0],
+                         attributes['GIS_Acres'], attributes['Assigned_Fire_Type']])
+        offset = wf_reader.tell()
+        feature = wf_reader.next()
+
+    out.close()
+    wf_reader.close()
+    progress(f"Indexed a total of {feature_count} features")
+    return 0
+
+
+#
+#   Rewrites the file with every ring converted from ESRI:102008 to EPSG:4326 lon,lat. The features are
+#   streamed, so this works on the full sized datasets. The output can be read again with the Reader.
+#
+def convert_command(args):
+    from pyproj import Transformer
+    to_wgs84 = Transformer.from_crs("ESRI:102008","EPSG:4326",always_xy=True)
+
+    wf_reader = Reader(args.file)
+    header = dict(wf_reader.header())
+    header['spatialReference'] = {"wkid": 4326, "latestWkid": 4326}
+
+    out = open(args.output or CONVERTED_FNAME, "w")
+    out.write(json.dumps(header)[:-1] + ', "features": [')
+
+    feature_count = 0
+    feature = wf_reader.next()
+    while feature:
+        geometry = feature.get('geometry') or dict()
+        rings = list()
+        for ring in geometry.get('rings') or list():
+            lons,lats = to_wgs84.transform([coord[0] for coord in ring],[coord[1] for coord in ring])
+            rings.append([[lon,lat] for lon,lat in zip(lons,lats)])
+        if 'rings' in geometry:
+            geometry['rings'] = rings
+        if feature_count:
+            out.write(', ')
+        out.write(json.dumps(feature))
+        feature_count += 1
+        if (feature_count % 10000) == 0:
+            progress(f"Converted {feature_count} features")
+        feature = wf_reader.next()
+
+    out.write(']}')
+    out.close()
+    wf_reader.close()
+    progress(f"Converted a total of {feature_count} features")
+    return 0
+
+
+#
+#   A place is either "lat,lon" in decimal degrees, or the name of one of the test_geocalc CITY_LOCATIONS,
+#   where just the city part of the name is enough, e.g. "kingman" for 'Kingman, AZ'
+#
+def parse_place(place=None):
+    try:
+        lat,lon = [float(v) for v in place.split(',')]
+        return [lat, lon]
+    except ValueError:
+        pass
+    from wildfire.test_geocalc import CITY_LOCATIONS
+    wanted = place.strip().lower()
+    for city in CITY_LOCATIONS:
+        for name, latlon in city.items():
+            if wanted in (name.lower(), name.split(',')[0].lower()):
+                return latlon
+    raise Exception(f"Could not find a place named '{place}', use 'lat,lon' or one of the CITY_LOCATIONS")
+
+
+#
+#   Produces the same CSV as the common analysis notebook, the closest perimeter point of every fire to a
+#   place and the distance in miles. The same fires are left out as in the notebook: fires with no listed
+#   names, and fires with only curved rings or an empty first ring.
+#
+def distance_command(args):
+    from pyproj import Transformer, Geod
+    from wildfire.test_geocalc import shortest_distance_from_place_to_fire_perimeter
+    place = parse_place(args.place)
+    to_wgs84 = Transformer.from_crs("ESRI:102008","EPSG:4326")
+    geodcalc = Geod(ellps='WGS84')
+
+    wf_reader = Reader(args.file)
+    out = open(args.output or DISTANCE_FNAME, "w", newline="")
+    writer = csv.writer(out)
+    writer.writerow(['year', 'id', 'name', 'size', 'type', 'close_lat', 'close_lon', 'distance'])
+
+    feature_count = 0
+    feature = wf_reader.next()
+    while feature:
+        feature_count += 1
+        if (feature_count % 1000) == 0:
+            progress(f"Measured {feature_count} features")
+        attributes = feature['attributes']
+        rings = (feature.get('geometry') or dict()).get('rings')
+        distance = list()
+        if rings and attributes['Listed_Fire_Names'] is not None:
+            distance = shortest_distance_from_place_to_fire_perimeter(place, rings[0], to_wgs84, geodcalc)
+        if distance:
+            writer.writerow([attributes['Fire_Year'], attributes['USGS_Assigned_ID'],
+                             attributes['Listed_Fire_Names'].split(',')[0],
+                             attributes['GIS_Acres'], attributes['Assigned_Fire_Type'],
+                             distance[1][0], distance[1][1], distance[0]])
+        feature = wf_reader.next()
+
+    out.close()
+    wf_reader.close()
+    progress(f"Measured a total of {feature_count} features")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m wildfire",
+                                     description="Streaming passes over USGS wildfire GeoJSON files")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    p = subparsers.add_parser("header", help="print the file header")
+    p.add_argument("file")
+    p.set_defaults(func=header_command)
+
+    p = subparsers.add_parser("count", help="count the features in the file")
+    p.add_argument("file")
+    p.set_defaults(func=count_command)
+
+    p = subparsers.add_parser("extract", help="extract the wildfires with matching names into a smaller file")
+    p.add_argument("file")
+    p.add_argument("--name", action="append", required=True,
+                   help="part of a listed fire name, may be repeated. Only features with an Assigned_Fire_Type "
+                        "of 'wildfire' are extracted (not prescribed burns or other types)")
+    p.add_argument("--year", type=int, default=None, help="only extract fires from this year")
+    p.add_argument("--output", default=None)
+    p.set_defaults(func=extract_command)
+
+    p = subparsers.add_parser("index", help="write a CSV index of feature file positions and attributes")
+    p.add_argument("file")
+    p.add_argument("--output", default=None)
+    p.set_defaults(func=index_command)
+
+    p = subparsers.add_parser("convert", help="convert the fire perimeters from ESRI:102008 to EPSG:4326")
+    p.add_argument("file")
+    p.add_argument("--output", default=None)
+    p.set_defaults(func=convert_command)
+
+    p = subparsers.add_parser("distance", help="write the distance from a place to every fire as CSV")
+    p.add_argument("file")
+    p.add_argument("--place", required=True, help="'lat,lon' or a CITY_LOCATIONS name, e.g. kingman")
+    p.add_argument("--output", default=None)
+    p.set_defaults(func=distance_command)
+    return parser
+
+
+def main(argv):
+    args = build_parser().parse_args(argv[1:])
+    return args.func(args)
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
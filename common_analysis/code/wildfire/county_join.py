@@ -0,0 +1,540 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#   FILE: county_join.py
+#   REVISION: October, 2026
+#   CREATION DATE: October, 2026
+#
+#   A batch stage that joins wildfire perimeters to county polygons and produces a county x year panel that
+#   can be merged directly with the county keyed graduation data and the yearly AQI data.
+#
+#   Copyright by Author. All rights reserved. Not for reuse without express permissions.
+#
+
+import sys, json, argparse
+
+import numpy as np
+import pandas as pd
+from pyproj import Transformer, Geod
+
+from wildfire.Reader import Reader
+from wildfire.Feature import Feature
+
+
+#
+#   The wildfire GeoJSON is in "ESRI:102008 NAD 1983 Albers North America" and county boundary files are
+#   normally in "EPSG:4326 (WGS84)" lon,lat. Rather than converting every fire vertex, the (far fewer) county
+#   vertices are projected once into ESRI:102008 so all of the geometry work happens in the fire's own space.
+#
+FIRE_CRS = "ESRI:102008"
+LATLON_CRS = "EPSG:4326"
+
+#
+#   County boundaries, as a GeoJSON FeatureCollection of county Polygons/MultiPolygons in EPSG:4326. The
+#   Census Bureau cartographic boundary files work well, after conversion from shapefile to GeoJSON
+#   https://www.census.gov/geographies/mapping-files/time-series/geo/cartographic-boundary.html
+#
+COUNTY_BOUNDARY_FNAME = "cb_2018_us_county_500k.json"
+WILDFIRE_FNAME = "USGS_Wildland_Fire_Combined_Dataset.json"
+PANEL_FNAME = "county_year_panel.csv"
+
+#
+#   The default counties and years of the panel. The counties are limited to one state by the two digit
+#   state FIPS code, e.g. "04" for Arizona. These can be changed from the command line, see main().
+#
+STATE_FIPS = "04"
+START_YEAR = 1963
+END_YEAR = 2020
+
+#
+#   These match the smoke impact estimate used in the common analysis - fires within 1250 miles, impact is
+#   acres burned divided by distance in miles, and the yearly sum is spread over the 184 day fire season
+#
+MAX_DISTANCE_MILES = 1250
+FIRE_SEASON_DAYS = 184
+MIN_DISTANCE_MILES = 1.0
+METERS_TO_MILES = 0.00062137
+
+#
+#   ESRI:102008 is equal-area, not conformal, so its scale depends on both latitude and direction (about
+#   1.054 north-south vs 0.948 east-west at 35N, and much more in northern Alaska). The projected distance
+#   pre-filter in smoke_contributions() uses the scale limits over the band of latitudes between a fire and a
+#   county, widened by this many degrees to cover the bulge of a geodesic or a projected straight line.
+#
+LATITUDE_MARGIN = 2
+
+#
+#   The grid cell size (in meters) of the county spatial index, and the largest number of (point, edge) or
+#   (county, vertex) pairs that are evaluated in one vectorized step
+#
+GRID_CELL_SIZE = 50000.0
+CHUNK_SIZE = 2000000
+
+
+class CountyIndex(object):
+    '''
+
+    This class holds a set of county polygons, projected into the ESRI:102008 coordinates of the wildfire
+    data, along with a uniform grid spatial index over the county bounding boxes. The class provides:
+        locate()       - to find the county containing each of an array of x,y points
+        centroids()    - the x,y centroid of each county, in ESRI:102008
+        frame()        - a pandas DataFrame describing the counties (County, state_fips, fips)
+
+    An index is normally created from a county boundary file
+
+        counties = CountyIndex.from_geojson("cb_2018_us_county_500k.json", state_fips="04")
+
+    '''
+    def __init__(self, names=None, state_fips=None, fips=None, polygons=None, cell_size=GRID_CELL_SIZE):
+        super().__init__()
+        self.names = list(names or list())
+        self.state_fips = list(state_fips or list())
+        self.fips = list(fips or list())
+        # each county polygon is a list of (n,2) arrays of rings, holes and multipolygon parts included
+        self.polygons = list(polygons or list())
+        self.cell_size = cell_size
+
+        if not self.polygons:
+            raise Exception("Must supply at least one county polygon to create a 'CountyIndex'")
+
+        self.bounds = np.array([self.__ring_bounds__(rings) for rings in self.polygons])
+        self.__build_grid__()
+        return
+
+
+    #####
+    #
+    #   PUBLIC METHODS
+    #
+    #####
+
+    @classmethod
+    def from_geojson(cls, fname=None, state_fips=None, cell_size=GRID_CELL_SIZE):
+        '''
+        This loads county polygons from a GeoJSON FeatureCollection file and returns a new CountyIndex.
+
+        The method takes the name of the county boundary file, and optionally a two digit state FIPS code
+        to only load the counties of one state. County properties are read from the Census style 'NAME',
+        'STATEFP' and 'GEOID' keys, or the 'NAME', 'STATE' and 'COUNTY' keys used by some other exports.
+
+        '''
+        if not fname:
+            raise Exception("Must supply a county boundary filename to 'from_geojson()'")
+
+        with open(fname, "r") as f:
+            collection = json.load(f)
+
+        to_fire_crs = Transformer.from_crs(LATLON_CRS, FIRE_CRS, always_xy=True)
+
+        names, states, fips, polygons = list(), list(), list(), list()
+        for county in collection.get('features', list()):
+            properties = county.get('properties') or dict()
+            state = str(properties.get('STATEFP', properties.get('STATE', ''))).zfill(2)
+            if state_fips and state != state_fips:
+                continue
+            geoid = properties.get('GEOID')
+            if not geoid:
+                geoid = state + str(properties.get('COUNTYFP', properties.get('COUNTY', ''))).zfill(3)
+
+            geometry = county.get('geometry') or dict()
+            if geometry.get('type') == 'Polygon':
+                parts = [geometry['coordinates']]
+            elif geometry.get('type') == 'MultiPolygon':
+                parts = geometry['coordinates']
+            else:
+                continue
+
+            rings = list()
+            for part in parts:
+                for ring in part:
+                    lonlat = np.asarray(ring, dtype=float)
+                    x, y = to_fire_crs.transform(lonlat[:,0], lonlat[:,1])
+                    rings.append(np.column_stack((x, y)))
+
+            names.append(properties.get('NAME', ''))
+            states.append(state)
+            fips.append(str(geoid))
+            polygons.append(rings)
+
+        return cls(names, states, fips, polygons, cell_size)
+
+
+    def __len__(self):
+        return len(self.polygons)
+
+
+    def frame(self):
+        '''
+        This returns a DataFrame with one row per county, 'County' is the county name as used in the
+        graduation data, e.g. 'Mohave'.
+
+        This method takes no parameters.
+
+        '''
+        return pd.DataFrame({'County': self.names, 'state_fips': self.state_fips, 'fips': self.fips})
+
+
+    def centroids(self):
+        '''
+        This returns an (m,2) array of the area weighted x,y centroid of each county, in ESRI:102008.
+
+        This method takes no parameters.
+
+        '''
+        if not hasattr(self, 'centroid_xy'):
+            self.centroid_xy = np.array([polygon_centroid(rings) for rings in self.polygons])
+        return self.centroid_xy
+
+
+    def locate(self, x=None, y=None):
+        '''
+        This finds the county that contains each point, returning an integer array of county positions in
+        this index, or -1 where a point is not in any of the counties.
+
+        The method takes two parameters, the arrays of x and y point coordinates in ESRI:102008.
+
+        '''
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        found = np.full(len(x), -1, dtype=np.int64)
+        if not len(x):
+            return found
+
+        # sort the points by their grid cell, so the points in a run of cells are one contiguous slice
+        cells = self.__cell_of__(x, y)
+        order = np.argsort(cells, kind='stable')
+        sorted_cells = cells[order]
+
+        for c, (ix0, iy0, ix1, iy1) in enumerate(self.county_cells):
+            candidates = list()
+            for ix in range(ix0, ix1+1):
+                start = np.searchsorted(sorted_cells, ix*self.ny+iy0, side='left')
+                end = np.searchsorted(sorted_cells, ix*self.ny+iy1, side='right')
+                if end > start:
+                    candidates.append(order[start:end])
+            if not candidates:
+                continue
+            candidates = np.concatenate(candidates)
+            candidates = candidates[found[candidates] < 0]
+            if not len(candidates):
+                continue
+            # cheap bounding box test before the point in polygon test
+            xmin, ymin, xmax, ymax = self.bounds[c]
+            px, py = x[candidates], y[candidates]
+            in_box = (px >= xmin) & (px <= xmax) & (py >= ymin) & (py <= ymax)
+            candidates = candidates[in_box]
+            if not len(candidates):
+                continue
+            inside = points_in_polygon(x[candidates], y[candidates], self.polygons[c])
+            found[candidates[inside]] = c
+        return found
+
+
+    #####
+    #
+    #   NON-PUBLIC (PRIVATE) METHODS
+    #
+    #####
+
+    def __ring_bounds__(self, rings=None):
+        xy = np.concatenate(rings)
+        return xy[:,0].min(), xy[:,1].min(), xy[:,0].max(), xy[:,1].max()
+
+    ####
+    #
+    #   The grid covers the bounding box of all of the counties. Each county is recorded with the block of
+    #   grid cells that its bounding box overlaps. Points outside of the grid are mapped to an unused cell.
+    #
+    def __build_grid__(self):
+        self.x0 = self.bounds[:,0].min()
+        self.y0 = self.bounds[:,1].min()
+        self.nx = int((self.bounds[:,2].max() - self.x0) // self.cell_size) + 1
+        self.ny = int((self.bounds[:,3].max() - self.y0) // self.cell_size) + 1
+        self.county_cells = list()
+        for xmin, ymin, xmax, ymax in self.bounds:
+            self.county_cells.append((int((xmin - self.x0) // self.cell_size),
+                                      int((ymin - self.y0) // self.cell_size),
+                                      int((xmax - self.x0) // self.cell_size),
+                                      int((ymax - self.y0) // self.cell_size)))
+        return
+
+    def __cell_of__(self, x=None, y=None):
+        ix = np.floor((x - self.x0) / self.cell_size).astype(np.int64)
+        iy = np.floor((y - self.y0) / self.cell_size).astype(np.int64)
+        outside = (ix < 0) | (ix >= self.nx) | (iy < 0) | (iy >= self.ny)
+        cells = ix*self.ny + iy
+        cells[outside] = -1
+        return cells
+
+
+
+####
+#
+#   Vectorized even-odd (ray casting) point in polygon test. The test counts how many polygon edges a ray
+#   from each point crosses, across all of the rings, so holes and multipolygon parts are handled without
+#   having to know which ring is which. Points are processed in chunks to bound the (point x edge) arrays.
+#
+def points_in_polygon(px=None, py=None, rings=None):
+    px = np.asarray(px, dtype=float)
+    py = np.asarray(py, dtype=float)
+    inside = np.zeros(len(px), dtype=bool)
+    for ring in rings:
+        x1, y1 = ring[:,0], ring[:,1]
+        x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+        dy = y2 - y1
+        dy[dy == 0] = np.inf     # horizontal edges are never crossed
+        step = max(1, CHUNK_SIZE // max(1, len(x1)))
+        for start in range(0, len(px), step):
+            cx = px[start:start+step, None]
+            cy = py[start:start+step, None]
+            spans = (y1 > cy) != (y2 > cy)
+            x_cross = x1 + (cy - y1) * (x2 - x1) / dy
+            crossings = np.count_nonzero(spans & (cx < x_cross), axis=1)
+            inside[start:start+step] ^= (crossings % 2) == 1
+    return inside
+
+
+####
+#
+#   The area weighted centroid of a polygon (shoelace formula). Holes are assumed to be wound opposite to
+#   the outer rings, as GeoJSON and ESRI both require, so their area is subtracted.
+#
+def polygon_centroid(rings=None):
+    area_sum, cx_sum, cy_sum = 0.0, 0.0, 0.0
+    for ring in rings:
+        x1, y1 = ring[:,0], ring[:,1]
+        x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+        cross = x1*y2 - x2*y1
+        area_sum += cross.sum() / 2.0
+        cx_sum += ((x1 + x2) * cross).sum() / 6.0
+        cy_sum += ((y1 + y2) * cross).sum() / 6.0
+    if area_sum == 0.0:
+        xy = np.concatenate(rings)
+        return xy[:,0].mean(), xy[:,1].mean()
+    return cx_sum / area_sum, cy_sum / area_sum
+
+
+####
+#
+#   Returns the list of (n,2) ring arrays from either a dictionary feature or a compact Feature. Features
+#   without 'rings' (e.g. only 'curveRings') return an empty list. Empty rings are kept as (0,2) arrays so
+#   that rings[0] is always the first ring in the file, the one the notebook measures.
+#
+def fire_rings(feature=None):
+    if isinstance(feature, Feature):
+        rings = list()
+        for i in range(feature.ring_count()):
+            rings.append(np.frombuffer(feature.ring(i), dtype=float).reshape(-1, 2))
+        return rings
+    rings = feature['geometry'].get('rings') or list()
+    return [np.asarray(ring, dtype=float).reshape(-1, len(ring[0]) if ring else 2)[:,:2] for ring in rings]
+
+
+def fire_attributes(feature=None):
+    if isinstance(feature, Feature):
+        return feature.Fire_Year, feature.USGS_Assigned_ID, feature.Listed_Fire_Names, feature.GIS_Acres, feature.Assigned_Fire_Type
+    attributes = feature['attributes']
+    return (attributes['Fire_Year'], attributes['USGS_Assigned_ID'], attributes['Listed_Fire_Names'],
+            attributes['GIS_Acres'], attributes['Assigned_Fire_Type'])
+
+
+####
+#
+#   Returns two (181,181) tables, indexed by [lowest latitude + 90, highest latitude + 90] in whole degrees,
+#   with the largest and the smallest ESRI:102008 scale factor (in any direction) over that band of
+#   latitudes. The projection is conic, so the scale does not depend on longitude.
+#
+def scale_limit_tables():
+    global SCALE_LIMIT_TABLES
+    if SCALE_LIMIT_TABLES is None:
+        from pyproj import Proj
+        lats = np.arange(-90, 91, dtype=float)
+        factors = Proj(FIRE_CRS).get_factors(np.full(len(lats), -96.0), np.clip(lats, -89.5, 89.5))
+        high = np.maximum(factors.meridional_scale, factors.parallel_scale)
+        low = np.minimum(factors.meridional_scale, factors.parallel_scale)
+        high_table = np.empty((len(lats), len(lats)))
+        low_table = np.empty((len(lats), len(lats)))
+        for i in range(len(lats)):
+            high_table[i,i:] = np.maximum.accumulate(high[i:])
+            low_table[i,i:] = np.minimum.accumulate(low[i:])
+        SCALE_LIMIT_TABLES = (high_table, low_table)
+    return SCALE_LIMIT_TABLES
+
+SCALE_LIMIT_TABLES = None
+
+
+####
+#
+#   This calculates the smoke contribution of one fire to every county within 'max_distance' miles, with
+#   the same estimate as the common analysis notebook: the geodesic distance (WGS84) from the county
+#   centroid to the closest point of the fire's first ring, rings[0], and an impact of acres/miles.
+#
+#   Measuring every vertex against every county is too slow for a whole state or the whole US, so the
+#   vertices are first pre-filtered in the projected ESRI:102008 space. If the projection scale between a
+#   county and the fire lies between s_low and s_high, every geodesic distance d_g relates to its projected
+#   distance d_p by d_p/s_high <= d_g <= d_p/s_low. A vertex with d_p > d_p_min * s_high/s_low is then
+#   geodesically further away than the vertex with the closest projected distance, so it cannot be the
+#   closest point. Only the remaining vertices are measured geodesically, and their minimum is exact.
+#
+#   Returns the county positions and the smoke impact (acres/miles) for each of those counties.
+#
+def smoke_contributions(vertices=None, acres=0.0, centroid_xy=None, centroid_lonlat=None,
+                        to_latlon=None, geodcalc=None, max_distance=MAX_DISTANCE_MILES):
+    # A cheap bounding box pre-filter, generous enough for the largest scale over North America (about 1.54)
+    reach = (max_distance / METERS_TO_MILES) * 1.6
+    xmin, ymin = vertices.min(axis=0)
+    xmax, ymax = vertices.max(axis=0)
+    dx = np.maximum(0.0, np.maximum(xmin - centroid_xy[:,0], centroid_xy[:,0] - xmax))
+    dy = np.maximum(0.0, np.maximum(ymin - centroid_xy[:,1], centroid_xy[:,1] - ymax))
+    candidates = np.nonzero((dx*dx + dy*dy) <= reach*reach)[0]
+    if not len(candidates):
+        return candidates, np.zeros(0)
+
+    v_lon, v_lat = to_latlon.transform(vertices[:,0], vertices[:,1])
+    v_lon, v_lat = np.asarray(v_lon), np.asarray(v_lat)
+
+    # the largest possible ratio of projected distances for the same geodesic distance, for each county
+    c_lat = centroid_lonlat[candidates,1]
+    lowest = np.floor(np.minimum(c_lat, v_lat.min())).astype(int) - LATITUDE_MARGIN
+    highest = np.ceil(np.maximum(c_lat, v_lat.max())).astype(int) + LATITUDE_MARGIN
+    lowest = np.clip(lowest, -90, 90) + 90
+    highest = np.clip(highest, -90, 90) + 90
+    high_table, low_table = scale_limit_tables()
+    tolerance = (high_table[lowest, highest] / low_table[lowest, highest])**2
+
+    meters = np.empty(len(candidates))
+    step = max(1, CHUNK_SIZE // len(vertices))
+    for start in range(0, len(candidates), step):
+        chunk = candidates[start:start+step]
+        c = centroid_xy[chunk]
+        d2 = (c[:,0,None] - vertices[None,:,0])**2 + (c[:,1,None] - vertices[None,:,1])**2
+        near = d2 <= d2.min(axis=1, keepdims=True) * tolerance[start:start+step,None]
+        # np.nonzero() is in row order, so each county's vertices are one contiguous run
+        rows, cols = np.nonzero(near)
+        c_lonlat = centroid_lonlat[chunk[rows]]
+        _, _, d = geodcalc.inv(c_lonlat[:,0], c_lonlat[:,1], v_lon[cols], v_lat[cols])
+        run_starts = np.concatenate(([0], np.cumsum(np.count_nonzero(near, axis=1))[:-1]))
+        meters[start:start+step] = np.minimum.reduceat(np.asarray(d), run_starts)
+
+    miles = np.maximum(meters * METERS_TO_MILES, MIN_DISTANCE_MILES)
+    keep = miles <= max_distance
+    return candidates[keep], acres / miles[keep]
+
+
+####
+#
+#   This streams every fire in the wildfire file once. Each fire is assigned to the county that contains
+#   the centroid of its perimeter, and its smoke contribution is added to every county within range. Only
+#   the running county x year sums are kept, so the whole dataset never needs to be in memory.
+#
+#   Returns two DataFrames: one row per fire with its assigned county, and the summed smoke impact per
+#   county position and year.
+#
+def join_fires_to_counties(fname=None, counties=None, max_distance=MAX_DISTANCE_MILES):
+    print(f"Attempting to open '{fname}'")
+    wf_reader = Reader(fname, compact=True)
+
+    to_latlon = Transformer.from_crs(FIRE_CRS, LATLON_CRS, always_xy=True)
+    geodcalc = Geod(ellps='WGS84')
+    centroid_xy = counties.centroids()
+    centroid_lonlat = np.column_stack(to_latlon.transform(centroid_xy[:,0], centroid_xy[:,1]))
+
+    fire_rows = list()
+    fire_x, fire_y = list(), list()
+    smoke_by_year = dict()
+
+    feature_count = 0
+    feature = wf_reader.next()
+    while feature:
+        feature_count += 1
+        if (feature_count % 1000) == 0:
+            print(f"Joined {feature_count} features")
+
+        rings = fire_rings(feature)
+        # features with only curved rings, or an empty first ring, are skipped like in the notebook
+        if rings and len(rings[0]):
+            year, fire_id, names, acres, fire_type = fire_attributes(feature)
+            name = (names or '').split(',')[0]
+            cx, cy = polygon_centroid(rings[:1])
+            fire_rows.append([year, fire_id, name, acres, fire_type])
+            fire_x.append(cx)
+            fire_y.append(cy)
+
+            positions, impact = smoke_contributions(rings[0], acres or 0.0, centroid_xy,
+                                                    centroid_lonlat, to_latlon, geodcalc, max_distance)
+            if len(positions):
+                if year not in smoke_by_year:
+                    smoke_by_year[year] = np.zeros(len(counties))
+                np.add.at(smoke_by_year[year], positions, impact)
+
+        feature = wf_reader.next()
+    wf_reader.close()
+    print(f"Joined a total of {feature_count} features")
+
+    fire_df = pd.DataFrame(fire_rows, columns=['year', 'id', 'name', 'size', 'type'])
+    fire_df['county_pos'] = counties.locate(np.array(fire_x), np.array(fire_y))
+
+    smoke_rows = list()
+    for year, totals in smoke_by_year.items():
+        for pos in np.nonzero(totals)[0]:
+            smoke_rows.append([year, pos, totals[pos]])
+    smoke_df = pd.DataFrame(smoke_rows, columns=['year', 'county_pos', 'smoke_impact'])
+    return fire_df, smoke_df
+
+
+####
+#
+#   Builds the county x year panel. Every county has a row for every year in the range, with zeros where
+#   there were no fires, so the panel can be merged on ['County','year'] with the graduation data and on
+#   'year' (or ['County','year']) with the AQI data.
+#
+def county_year_panel(fire_df=None, smoke_df=None, counties=None, start_year=START_YEAR, end_year=END_YEAR):
+    county_df = counties.frame()
+    county_df['county_pos'] = np.arange(len(county_df))
+    years = pd.DataFrame({'year': np.arange(start_year, end_year+1)})
+    panel = county_df.merge(years, how='cross')
+
+    located = fire_df.loc[fire_df['county_pos'] >= 0]
+    burned = located.groupby(['county_pos', 'year']).agg(fire_count=('id', 'count'), acres_burned=('size', 'sum'))
+    panel = panel.merge(burned.reset_index(), on=['county_pos', 'year'], how='left')
+    panel = panel.merge(smoke_df, on=['county_pos', 'year'], how='left')
+
+    panel[['fire_count', 'acres_burned', 'smoke_impact']] = panel[['fire_count', 'acres_burned', 'smoke_impact']].fillna(0)
+    panel['fire_count'] = panel['fire_count'].astype(int)
+    panel['smoke_impact'] = panel['smoke_impact'] / FIRE_SEASON_DAYS
+    panel = panel.drop(['county_pos'], axis=1)
+    return panel.sort_values(['fips', 'year']).reset_index(drop=True)
+
+
+##
+#
+#   python3 county_join.py [wildfire_file] [county_boundary_file] [output_csv]
+#                          [--state FIPS|all] [--start-year YEAR] [--end-year YEAR] [--max-distance MILES]
+#
+#
+def main(argv):
+    parser = argparse.ArgumentParser(prog="county_join.py",
+                                     description="Join wildfires to county polygons as a county x year panel")
+    parser.add_argument("wildfire_file", nargs="?", default=WILDFIRE_FNAME)
+    parser.add_argument("county_boundary_file", nargs="?", default=COUNTY_BOUNDARY_FNAME)
+    parser.add_argument("output_csv", nargs="?", default=PANEL_FNAME)
+    parser.add_argument("--state", default=STATE_FIPS,
+                        help=f"two digit state FIPS code, or 'all' for every county (default {STATE_FIPS})")
+    parser.add_argument("--start-year", type=int, default=START_YEAR)
+    parser.add_argument("--end-year", type=int, default=END_YEAR)
+    parser.add_argument("--max-distance", type=float, default=MAX_DISTANCE_MILES,
+                        help=f"largest fire to county distance in miles (default {MAX_DISTANCE_MILES})")
+    args = parser.parse_args(argv[1:])
+
+    state_fips = None if args.state.lower() == "all" else args.state.zfill(2)
+    counties = CountyIndex.from_geojson(args.county_boundary_file, state_fips=state_fips)
+    print(f"Loaded {len(counties)} county polygons from '{args.county_boundary_file}'")
+
+    fire_df, smoke_df = join_fires_to_counties(args.wildfire_file, counties, args.max_distance)
+    panel = county_year_panel(fire_df, smoke_df, counties, args.start_year, args.end_year)
+    panel.to_csv(args.output_csv, index=False)
+    print(f"Wrote {len(panel)} county x year rows to '{args.output_csv}'")
+    return
+
+if __name__ == '__main__':
+    main(sys.argv)
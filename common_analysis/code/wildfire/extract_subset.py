@@ -105,16 +105,21 @@ WILDFIRE_FNAME = "/Users/dwmc/datasets/wildfire_data/GeoJSON Exports/USGS_Wildla
 SAMPLE_FNAME = "extraction_sample.json"
 
 
-def streaming_load_feature_count(fname=None,show_features=False):
-    print(f"Attempting to open '{fname}'")
+#
+#   All of the output goes to 'out', so a caller that wants only the count (like the command line) can send
+#   the messages to sys.stderr
+#
+def streaming_load_feature_count(fname=None,show_features=False,show_header=True,out=sys.stdout):
+    print(f"Attempting to open '{fname}'",file=out)
     wf_reader = Reader(fname)
     
     # get the header of the file
     header = wf_reader.header()
     
     # dump the header as output
-    print("HEADER DICT")
-    print(json.dumps(header,indent=4))
+    if show_header:
+        print("HEADER DICT",file=out)
+        print(json.dumps(header,indent=4),file=out)
     
     # now try to load the whole thing - one feature at a time - streaming
     feature_count = 0
@@ -122,17 +127,22 @@ def streaming_load_feature_count(fname=None,show_features=False):
     while feature:
         feature_count += 1
         if show_features:
-            print(json.dumps(feature,indent=4))
+            print(json.dumps(feature,indent=4),file=out)
         if (feature_count % 1000) == 0:
-            print(f"Loaded {feature_count} features")
+            print(f"Loaded {feature_count} features",file=out)
         
         feature = wf_reader.next()
     
-    print(f"Loaded a total of {feature_count} features")
-    return
+    print(f"Loaded a total of {feature_count} features",file=out)
+    wf_reader.close()
+    return feature_count
     
 
-def extract_samples_by_name(fname=None):
+#
+#   The fires to look for are a dictionary keyed by (lower case) name, like BIG_CA_FIRES_BY_NAME. A fire
+#   with a 'year' of None matches a fire with that name in any year.
+#
+def extract_samples_by_name(fname=None,fires=BIG_CA_FIRES_BY_NAME,out_fname=SAMPLE_FNAME):
     print(f"Attempting to open '{fname}'")
     wf_reader = Reader(fname)
     
@@ -148,19 +158,20 @@ def extract_samples_by_name(fname=None):
         
         attributes = feature['attributes']
         
-        listed_names = attributes["Listed_Fire_Names"].lower()
+        listed_names = (attributes["Listed_Fire_Names"] or '').lower()
         
-        for name in BIG_CA_FIRES_BY_NAME:
+        for name in fires:
             n = str(name)
             if n in listed_names:
-                if attributes['Fire_Year'] == BIG_CA_FIRES_BY_NAME[name]['year']:
-                    fire_type = attributes['Assigned_Fire_Type'].lower()
+                if fires[name].get('year') in (None, attributes['Fire_Year']):
+                    fire_type = (attributes['Assigned_Fire_Type'] or '').lower()
                     if "wildfire" in fire_type:
                         print(f"MAYBE FOUND FIRE: {n}")
                         print(json.dumps(attributes,indent=4))
-                        print(json.dumps(BIG_CA_FIRES_BY_NAME[name],indent=4))
+                        print(json.dumps(fires[name],indent=4))
                         feature_list.append(feature)
                         found_count += 1
+                        break
         
         feature = wf_reader.next()
     
@@ -170,10 +181,11 @@ def extract_samples_by_name(fname=None):
     header = wf_reader.header()
     header['features'] = feature_list
     
-    f = open(SAMPLE_FNAME,"w")
+    f = open(out_fname,"w")
     json.dump(header,f)
     f.close()
-    return
+    wf_reader.close()
+    return found_count
 
 
 
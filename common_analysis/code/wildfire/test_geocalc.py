@@ -32,8 +32,9 @@ from wildfire.Reader import Reader
 #   One 'helpful' stack overflow post was:
 #   https://gis.stackexchange.com/questions/304231/converting-nad83-epsg4269-to-wgs84-epsg4326-using-pyproj
 #   
-import pyproj
-from pyproj import Transformer, Geod
+#   pyproj is slow to import, so it is imported inside the functions that need it. That keeps this module
+#   cheap to import for things like the CITY_LOCATIONS lookup in the wildfire command line.
+#
 
 
 #Standard Reference Systems (SRS)
@@ -56,7 +57,8 @@ CITY_LOCATIONS = [
     {'Crescent City, CA'   : [41.7558, -124.2026] }, 
     {'Tomales, CA'         : [38.2463, -122.9056] }, 
     {'San Luis Obispo, CA' : [35.2828, -120.6596] }, 
-    {'Encinitas, CA'       : [33.0370, -117.2920] } 
+    {'Encinitas, CA'       : [33.0370, -117.2920] }, 
+    {'Kingman, AZ'         : [35.1898, -114.0607] } 
 ]
 
 
@@ -70,6 +72,7 @@ SAMPLE_FNAME = "Wildfire_short_sample.json"
 
 
 def distance_calc_test():
+    from pyproj import Geod
 
     #g = Geod(ellps='clrk66')       # Use Clarke 1866 ellipsoid.
     g = Geod(ellps='WGS84')         # Use WGS84 ellipsoid.
@@ -98,6 +101,29 @@ def distance_calc_test():
     return
 
 
+#
+#   Find the shortest distance from a place to a fire perimeter. The place is a (lat,lon) in decimal degrees
+#   EPSG:4326 and ring_data is a list of ESRI:102008 x,y coordinates for the fire boundary. Returns a list of
+#   the distance in miles and the (lat,lon) of the closest perimeter point, like the version in the notebook.
+#   The whole ring is projected and measured in one call, rather than one point at a time. The transformer
+#   and geod can be passed in so they are only created once when working through many fires.
+#
+def shortest_distance_from_place_to_fire_perimeter(place=None, ring_data=None, to_wgs84=None, geodcalc=None):
+    from pyproj import Transformer, Geod
+    if not to_wgs84:
+        to_wgs84 = Transformer.from_crs("ESRI:102008","EPSG:4326")
+    if not geodcalc:
+        geodcalc = Geod(ellps='WGS84')
+    if not ring_data:
+        return list()
+    xs = [coord[0] for coord in ring_data]
+    ys = [coord[1] for coord in ring_data]
+    lats,lons = to_wgs84.transform(xs,ys)
+    lats,lons = list(lats),list(lons)
+    az12,az21,dists = geodcalc.inv([place[1]]*len(lats),[place[0]]*len(lats),lons,lats)
+    dists = list(dists)
+    closest = min(range(len(dists)), key=dists.__getitem__)
+    return [dists[closest]*0.00062137, (lats[closest],lons[closest])]
 
 
 ##
@@ -106,6 +132,8 @@ def distance_calc_test():
 #
 #
 def main(argv):
+    import pyproj
+    from pyproj import Transformer
     
     distance_calc_test()
     